@@ -1,4 +1,4 @@
 """GPU Monitor Statusbar package."""
 __version__ = "0.1.0"
 
-from .app import GPUMonitorStatusbar, have_nvidia_smi
\ No newline at end of file
+from .app import GPUMonitorStatusbar, have_nvidia_smi, have_nvml
\ No newline at end of file
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import argparse
+import atexit
+import functools
+import os
+import select
 import shutil
 import subprocess
 import sys
+import threading
 import time
 import tkinter as tk
+from typing import List, NamedTuple, Optional, Tuple
 
 # Optional psutil for CPU/NET
 try:
@@ -13,51 +19,258 @@ try:
 except Exception:
     psutil = None
 
+# Optional pynvml (nvidia-ml-py) for in-process GPU queries
+try:
+    import pynvml  # type: ignore
+except Exception:
+    pynvml = None
+
 # ----------------------------- Helpers -----------------------------
 
+@functools.lru_cache(maxsize=1)
+def nvidia_smi_path():
+    # Absolute path: together with close_fds=False this lets CPython launch via posix_spawn
+    return shutil.which("nvidia-smi")
+
 def have_nvidia_smi() -> bool:
-    return shutil.which("nvidia-smi") is not None
+    return nvidia_smi_path() is not None
+
+def have_nvml() -> bool:
+    return pynvml is not None
+
+def run_nvidia_smi(*args) -> bytes:
+    """Runs nvidia-smi once and returns raw stdout; raises CalledProcessError on failure."""
+    # Our fds are non-inheritable (PEP 446), so close_fds=False is safe; with an
+    # absolute executable path CPython can then use posix_spawn instead of fork+exec.
+    proc = subprocess.Popen(
+        [nvidia_smi_path() or "nvidia-smi", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
+    )
+    out, _ = proc.communicate()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, out)
+    return out
 
+@functools.lru_cache(maxsize=1)
 def get_gpu_count() -> int:
-    out = subprocess.check_output(
-        ["nvidia-smi", "--list-gpus"],
-        encoding="utf-8"
-    )
+    # nvidia-smi path only; the NVML backend counts its own device handles
+    out = run_nvidia_smi("--list-gpus")
     return len(out.strip().splitlines())
 
-def query_gpu_metrics(index: int = 0):
-    """Returns (util, power, temp) as floats. Util%, Power W, Temp C."""
-    out = subprocess.check_output(
-        [
-            "nvidia-smi",
-            "--query-gpu=utilization.gpu,power.draw,temperature.gpu",
-            "--format=csv,noheader,nounits",
-            "-i",
-            str(index),
-        ],
-        encoding="utf-8",
-        stderr=subprocess.STDOUT,
+def _csv_float(tok: bytes):
+    try:
+        return float(tok)
+    except ValueError:
+        return None  # "[N/A]", "[Not Supported]", ...
+
+def parse_csv_row(line: bytes, n: int):
+    """First n fields of a `--format=csv,noheader,nounits` row; unreadable fields are None."""
+    # nvidia-smi separates fields with ", " so one split needs no per-field strip;
+    # float() tolerates the trailing newline/CR. Only a short row raises ValueError.
+    parts = line.split(b", ", n)
+    if len(parts) < n:
+        raise ValueError(f"Unexpected nvidia-smi row: {line!r}")
+    return tuple(_csv_float(p) for p in parts[:n])
+
+def query_gpu_metrics():
+    """Returns [(util, power, temp) or None, ...] for all GPUs from a single nvidia-smi call."""
+    out = run_nvidia_smi(
+        "--query-gpu=utilization.gpu,power.draw,temperature.gpu",
+        "--format=csv,noheader,nounits",
     )
-    line = out.strip().splitlines()[0] if out.strip() else ""
-    parts = [p.strip() for p in line.split(",")]
-    if len(parts) < 3:
-        raise RuntimeError(f"Unexpected nvidia-smi output: {out!r}")
-    return float(parts[0]), float(parts[1]), float(parts[2])
+    metrics = []
+    for line in out.strip().split(b"\n"):
+        try:
+            metrics.append(parse_csv_row(line, 3))
+        except ValueError:
+            metrics.append(None)  # keep positions aligned with GPU indices
+    return metrics
+
+def persistence_disabled_gpus():
+    """Indices of GPUs whose persistence mode is off, per nvidia-smi."""
+    out = run_nvidia_smi("--query-gpu=index,persistence_mode", "--format=csv,noheader")
+    disabled = []
+    for line in out.strip().split(b"\n"):
+        # Same ", " single split as parse_csv_row; rstrip only drops a Windows "\r"
+        parts = line.rstrip().split(b", ", 2)
+        if len(parts) >= 2 and parts[1] == b"Disabled":
+            disabled.append(int(parts[0]))
+    return disabled
+
+# The stream backend treats readings older than 3 loop periods (at least this) as failed
+STREAM_STALE_MIN_MS = 5000
+
+# GPU backends: both expose count() and query_all() -> [(util, power, temp) or None, ...]
+# where a GPU is None before its first reading and any single field may be None
+# when that sensor is unsupported or failed.
+class _NvmlBackend:
+    """Reads GPU metrics in-process through NVML; handles are resolved once."""
+    backoff = True  # each query_all costs NVML calls, so slowing it down when idle pays off
+    def __init__(self):
+        pynvml.nvmlInit()
+        atexit.register(pynvml.nvmlShutdown)
+        self._handles = [
+            pynvml.nvmlDeviceGetHandleByIndex(i)
+            for i in range(pynvml.nvmlDeviceGetCount())
+        ]
+
+    def count(self) -> int:
+        return len(self._handles)
+
+    def persistence_disabled(self):
+        disabled = []
+        for i, h in enumerate(self._handles):
+            try:
+                if pynvml.nvmlDeviceGetPersistenceMode(h) == pynvml.NVML_FEATURE_DISABLED:
+                    disabled.append(i)
+            except pynvml.NVMLError:
+                pass  # e.g. NotSupported on Windows/WDDM
+        return disabled
+
+    def query_all(self):
+        # Bind once per tick so the per-device loop does no module attribute lookups
+        get_util = pynvml.nvmlDeviceGetUtilizationRates
+        get_power = pynvml.nvmlDeviceGetPowerUsage
+        get_temp = pynvml.nvmlDeviceGetTemperature
+        sensor = pynvml.NVML_TEMPERATURE_GPU
+        NVMLError = pynvml.NVMLError
+        metrics = []
+        # Per-field try: e.g. power is NotSupported on some cards; other GPUs/fields still show
+        for h in self._handles:
+            try:
+                util = float(get_util(h).gpu)
+            except NVMLError:
+                util = None
+            try:
+                power = get_power(h) / 1000.0  # mW -> W
+            except NVMLError:
+                power = None
+            try:
+                temp = float(get_temp(h, sensor))
+            except NVMLError:
+                temp = None
+            metrics.append((util, power, temp))
+        return metrics
+
+class _SmiStreamBackend:
+    """Fallback: one long-lived `nvidia-smi --loop-ms` process streamed by a reader thread."""
+    backoff = False  # nvidia-smi samples at a fixed rate anyway; query_all is a dict read
+    def __init__(self, interval_ms: int):
+        self._count = get_gpu_count()
+        # index -> (monotonic time, sample); readings older than this are reported as failed,
+        # which catches a hung nvidia-smi or a dead reader thread
+        self._stale_s = max(3 * int(interval_ms), STREAM_STALE_MIN_MS) / 1000
+        self._latest = {}
+        # Prime so the first refresh has data before the stream catches up
+        try:
+            now = time.monotonic()
+            self._latest = {i: (now, m) for i, m in enumerate(query_gpu_metrics()) if m is not None}
+        except Exception:
+            pass
+        self._proc = subprocess.Popen(
+            [
+                nvidia_smi_path() or "nvidia-smi",
+                "--query-gpu=index,utilization.gpu,power.draw,temperature.gpu",
+                "--format=csv,noheader,nounits",
+                f"--loop-ms={int(interval_ms)}",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+        )
+        atexit.register(self.close)
+        threading.Thread(target=self._reader, daemon=True).start()
+
+    def _handle_line(self, line: bytes):
+        try:
+            index, util, power, temp = parse_csv_row(line, 4)
+            index = int(index)
+        except (TypeError, ValueError, OverflowError):
+            return  # short row, or index is [N/A]/nan/inf
+        # single dict store, atomic under the GIL
+        self._latest[index] = (time.monotonic(), (util, power, temp))
+
+    def _reader(self):
+        stdout = self._proc.stdout
+        if not hasattr(select, "epoll"):  # non-Linux: plain blocking reads
+            for line in stdout:
+                self._handle_line(line)
+            return
+        # Non-blocking fd + epoll: sleep in the kernel until data or EOF arrives
+        fd = stdout.fileno()
+        os.set_blocking(fd, False)
+        ep = select.epoll()
+        ep.register(fd, select.EPOLLIN)
+        buf = b""
+        try:
+            while True:
+                ep.poll()
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    break  # nvidia-smi exited
+                *lines, buf = (buf + chunk).split(b"\n")
+                for line in lines:
+                    self._handle_line(line)
+        finally:
+            ep.close()
+
+    def count(self) -> int:
+        return self._count
+
+    def persistence_disabled(self):
+        return persistence_disabled_gpus()
+
+    def query_all(self):
+        if self._proc.poll() is not None:
+            raise RuntimeError("nvidia-smi stream exited")
+        latest = self._latest
+        oldest = time.monotonic() - self._stale_s
+        metrics = []
+        for i in range(self._count):
+            entry = latest.get(i)
+            if entry is None:
+                metrics.append(None)  # no reading yet
+            elif entry[0] < oldest:
+                metrics.append((None, None, None))  # stale: render as failed
+            else:
+                metrics.append(entry[1])
+        return metrics
+
+    def close(self):
+        if self._proc.poll() is None:
+            self._proc.terminate()
+
+def make_gpu_backend(interval_ms: int):
+    """NVML if it initialises, else streamed nvidia-smi; RuntimeError if neither works."""
+    if pynvml is not None:
+        try:
+            return _NvmlBackend()
+        except pynvml.NVMLError:
+            pass
+    if not have_nvidia_smi():
+        nvml = "pynvml is not installed" if pynvml is None else "NVML could not be initialised"
+        raise RuntimeError(f"{nvml} and nvidia-smi was not found in PATH.")
+    try:
+        return _SmiStreamBackend(interval_ms)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise RuntimeError(f"nvidia-smi failed ({e}).") from e
+
+# green / amber / red, indexed by how many thresholds were crossed
+_LEVEL_COLORS = ("#22c55e", "#f59e0b", "#ef4444")
 
 def color_for_util(x: float) -> str:
-    if x < 40: return "#22c55e"  # green
-    if x < 70: return "#f59e0b"  # amber
-    return "#ef4444"             # red
+    return _LEVEL_COLORS[(x >= 40) + (x >= 70)]
 
 def color_for_temp(t: float) -> str:
-    if t < 70: return "#22c55e"
-    if t < 85: return "#f59e0b"
-    return "#ef4444"
+    return _LEVEL_COLORS[(t >= 70) + (t >= 85)]
 
 def color_for_cpu(c: float) -> str:
-    if c < 40: return "#22c55e"
-    if c < 75: return "#f59e0b"
-    return "#ef4444"
+    return _LEVEL_COLORS[(c >= 40) + (c >= 75)]
 
 # CPU & NET helpers
 def get_cpu_percent() -> float:
@@ -66,51 +279,137 @@ def get_cpu_percent() -> float:
     # minimal fallback: show 0 if psutil not present
     return 0.0
 
-def get_net_bytes_recv(iface=None):
-    # psutil path
-    if psutil:
-        counters = psutil.net_io_counters(pernic=True)
-        if iface and iface in counters:
-            return counters[iface].bytes_recv
-        candidates = {k:v for k,v in counters.items() if not k.startswith("lo")}
-        if not candidates:
-            return 0
-        name = max(candidates, key=lambda k: counters[k].bytes_recv + counters[k].bytes_sent)
-        return counters[name].bytes_recv
-    # fallback (Linux)
-    try:
-        with open("/proc/net/dev", "r") as f:
-            lines = f.readlines()
+class _ProcNetDev:
+    """Linux fallback: keeps /proc/net/dev open and parses it as raw bytes."""
+    def __init__(self, path="/proc/net/dev"):
+        self._fd = os.open(path, os.O_RDONLY)
+
+    def _read(self) -> bytes:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        chunks = []
+        while True:
+            chunk = os.read(self._fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def rx_bytes(self, iface: str) -> int:
+        # Lines look like "  eth0: <rx_bytes> ..."; only the first field is parsed
+        data = self._read()
+        key = iface.encode() + b":"
+        pos = data.find(key)
+        while pos > 0 and data[pos - 1] not in b" \n":
+            pos = data.find(key, pos + 1)
+        if pos < 0:
+            raise KeyError(iface)
+        start = pos + len(key)
+        end = data.find(b"\n", start)
+        return int(data[start:end if end >= 0 else None].split(None, 1)[0])
+
+    def rx_table(self):
+        # The two header lines carry no ':' so they are skipped naturally
+        data = self._read()
         stats = {}
-        for ln in lines[2:]:
-            if ":" not in ln:
-                continue
-            name, rest = ln.split(":", 1)
-            name = name.strip()
-            cols = rest.split()
-            if len(cols) >= 1:
-                rx_bytes = int(cols[0])
-                stats[name] = rx_bytes
-        candidates = {k:v for k,v in stats.items() if not k.startswith("lo")}
-        if not candidates:
-            return 0
-        name = max(candidates, key=lambda k: candidates[k])
-        return candidates[name]
+        pos = 0
+        while True:
+            colon = data.find(b":", pos)
+            if colon < 0:
+                break
+            line_start = data.rfind(b"\n", 0, colon) + 1
+            end = data.find(b"\n", colon)
+            if end < 0:
+                end = len(data)
+            cols = data[colon + 1:end].split(None, 1)
+            if cols:
+                stats[data[line_start:colon].strip().decode()] = int(cols[0])
+            pos = end
+        return stats
+
+_proc_net_dev = None
+
+def _get_proc_net_dev():
+    global _proc_net_dev
+    if _proc_net_dev is None:
+        _proc_net_dev = _ProcNetDev()
+    return _proc_net_dev
+
+def resolve_net_iface(iface=None):
+    """Returns iface if it exists, else the busiest non-loopback interface (or None)."""
+    try:
+        if psutil:
+            counters = psutil.net_io_counters(pernic=True)
+            if iface and iface in counters:
+                return iface
+            traffic = ((k, v.bytes_recv + v.bytes_sent) for k, v in counters.items())
+        else:
+            stats = _get_proc_net_dev().rx_table()
+            if iface and iface in stats:
+                return iface
+            traffic = stats.items()
     except Exception:
-        return 0
+        return None
+    best, best_total = None, -1
+    for name, total in traffic:
+        if not name.startswith("lo") and total > best_total:
+            best, best_total = name, total
+    return best
+
+def get_net_bytes_recv(iface):
+    """Bytes received on iface; raises KeyError if it has disappeared."""
+    if psutil:
+        return psutil.net_io_counters(pernic=True)[iface].bytes_recv
+    # fallback (Linux)
+    if iface is None:
+        raise KeyError(iface)
+    return _get_proc_net_dev().rx_bytes(iface)
+
+# Adaptive GPU polling: back off while GPU utilisation is flat, snap back on change.
+# Only the GPU query backs off; CPU/NET keep sampling every interval.
+CALM_UTIL_DELTA = 2.0  # % points
+CALM_TICKS = 5         # consecutive calm polls before doubling the delay
+MAX_POLL_MS = 5000
+
+def next_poll_delay(delay_ms, base_ms, calm, prev_utils, utils):
+    """Returns (delay_ms, calm) for the next poll given two util readings."""
+    if (prev_utils is None or utils is None or len(prev_utils) != len(utils)
+            or any(abs(a - b) >= CALM_UTIL_DELTA for a, b in zip(prev_utils, utils))):
+        return base_ms, 0
+    calm += 1
+    if calm >= CALM_TICKS:
+        return min(delay_ms * 2, max(base_ms, MAX_POLL_MS)), 0
+    return delay_ms, calm
 
 def get_net_download_mbps(prev_bytes, curr_bytes, delta_sec):
     if delta_sec <= 0: return 0.0
     return max(0, (curr_bytes - prev_bytes) / (1024*1024)) / delta_sec  # MB/s
 
+def text_from_table(table, x, fmt):
+    # Pre-built string for the rounded value; format only when out of range.
+    # round() rounds half to even, exactly like the "{:.0f}" fallback.
+    i = round(x)
+    if 0 <= i < len(table):
+        return table[i]
+    return fmt.format(x)
+
+class Snapshot(NamedTuple):
+    """One coalesced GPU/CPU/NET sample produced by the polling thread."""
+    t: float                                                     # time.time() of the CPU/NET sample
+    gpu_t: float                                                 # time.time() of the GPU query (may lag t)
+    gpus: Optional[List[Optional[Tuple[Optional[float], ...]]]]  # None if the GPU query failed
+    cpu: Optional[float]
+    net_mbps: float
+
 # ----------------------------- UI -----------------------------
 
 class GPUMonitorStatusbar(tk.Tk):
     def __init__(self, interval_ms=1000, scale=1.0, iface=None, xmargin=8):
+        # Pick the GPU backend before creating any window so failures exit cleanly
+        self.interval_ms = max(250, int(interval_ms))
+        self.gpu = make_gpu_backend(self.interval_ms)
+        self.gpu_count = self.gpu.count()
         super().__init__()
 
-        self.gpu_count = get_gpu_count()
-        self.interval_ms = max(250, int(interval_ms))
         self.scale = float(scale) if scale > 0 else 1.0
         self.drag_start = None
         self.borderless = True
@@ -120,7 +419,8 @@ class GPUMonitorStatusbar(tk.Tk):
         if psutil:
             psutil.cpu_percent(interval=None)  # warm up
 
-        self._prev_rx = get_net_bytes_recv(self.iface)
+        self._iface_name = resolve_net_iface(self.iface)
+        self._prev_rx = self.read_net_rx()
         self._prev_time = time.time()
 
         # UI 초기화
@@ -153,7 +453,8 @@ class GPUMonitorStatusbar(tk.Tk):
         self.minsize(800, 1)
 
         # GPU별 라벨
-        self.gpu_labels = []
+        # Kept as parallel per-field lists so render walks them side by side
+        self._util_lbls, self._power_lbls, self._temp_lbls = [], [], []
         col = 0
         def add_label(text, fg="#e5e7eb"):
             nonlocal col
@@ -169,7 +470,9 @@ class GPUMonitorStatusbar(tk.Tk):
             util = add_label("--%", fg="#9ca3af"); add_sep()
             power = add_label("-- W", fg="#e5e7eb"); add_sep()
             temp = add_label("-- °C", fg="#9ca3af"); add_sep()
-            self.gpu_labels.append((util, power, temp))
+            self._util_lbls.append(util)
+            self._power_lbls.append(power)
+            self._temp_lbls.append(temp)
 
         # CPU & NET
         self.lbl_cpu_tag = add_label("CPU ", fg="#e5e7eb")
@@ -179,6 +482,15 @@ class GPUMonitorStatusbar(tk.Tk):
 
         self.update_idletasks()
         self.place_top_right_y0()
+
+        # Metrics are polled off the Tk thread into a shared snapshot; refresh only draws it
+        self._latest_snap = None  # 1-slot mailbox: only the newest Snapshot matters
+        self._drawn = None
+        self._last = {}  # label -> last rendered (text, fg)
+        self._pct_strs = [f"{i}%" for i in range(101)]
+        self._temp_strs = [f"{i} °C" for i in range(121)]
+        self._watt_strs = [f"{i} W" for i in range(1001)]
+        threading.Thread(target=self._poll_loop, daemon=True).start()
         self.after(200, self.refresh)
 
     # Initial placement only (no auto return after move)
@@ -214,32 +526,120 @@ class GPUMonitorStatusbar(tk.Tk):
         self.borderless = not self.borderless
         self.overrideredirect(self.borderless)
 
-    # Refresh loop (no auto-snap back)
-    def refresh(self):
-        # GPU들 모두 업데이트
-        for i, (util_lbl, power_lbl, temp_lbl) in enumerate(self.gpu_labels):
+    def read_net_rx(self):
+        # Cached interface; re-resolve only when it goes away
+        try:
+            return get_net_bytes_recv(self._iface_name)
+        except KeyError:
+            self._iface_name = resolve_net_iface(self.iface)
+        except Exception:
+            return 0
+        try:
+            return get_net_bytes_recv(self._iface_name)
+        except Exception:
+            return 0
+
+    # Polling loop (worker thread): never touches Tk widgets
+    def _poll_loop(self):
+        gpu_delay_ms, calm, prev_utils = self.interval_ms, 0, None
+        gpus, gpu_t, next_gpu_at = None, 0.0, 0.0
+        period = self.interval_ms / 1000
+        deadline = time.monotonic()  # first sample right away
+        while True:
+            mono = time.monotonic()
+            if deadline > mono:
+                time.sleep(deadline - mono)
+                mono = time.monotonic()
+            # Fixed-rate schedule; if a poll overran, restart from now instead of bursting
+            deadline += period
+            if deadline <= mono:
+                deadline = mono + period
+            if mono >= next_gpu_at:  # otherwise reuse the previous GPU reading
+                gpu_t = time.time()
+                try:
+                    gpus = self.gpu.query_all()
+                except Exception:
+                    gpus = None
+                if self.gpu.backoff:
+                    utils = None if gpus is None else [g[0] if g and g[0] is not None else 0.0 for g in gpus]
+                    gpu_delay_ms, calm = next_poll_delay(gpu_delay_ms, self.interval_ms, calm, prev_utils, utils)
+                    prev_utils = utils
+                next_gpu_at = mono + gpu_delay_ms / 1000
             try:
-                util, power, temp = query_gpu_metrics(i)
-                util_lbl.config(text=f"{util:.0f}%", fg=color_for_util(util))
-                power_lbl.config(text=f"{power:.0f} W", fg="#e5e7eb")
-                temp_lbl.config(text=f"{temp:.0f} °C", fg=color_for_temp(temp))
+                cpu = get_cpu_percent()
             except Exception:
-                util_lbl.config(text="err", fg="#ef4444")
-                power_lbl.config(text="n/a", fg="#f59e0b")
-                temp_lbl.config(text="-- °C", fg="#9ca3af")
+                cpu = None
+            now = time.time()
+            curr_rx = self.read_net_rx()
+            mbps = get_net_download_mbps(self._prev_rx, curr_rx, now - self._prev_time)
+            self._prev_rx, self._prev_time = curr_rx, now
+            # Rebinding is atomic; readers never see a half-written sample
+            self._latest_snap = Snapshot(now, gpu_t, gpus, cpu, mbps)
+
+    def get_snapshot(self):
+        """Latest Snapshot, or None before the first poll.
+
+        This is the only place consumers (UI, loggers, exporters) should read
+        metrics from; they must not query NVML/nvidia-smi themselves.
+        """
+        return self._latest_snap
+
+    # Refresh loop (no auto-snap back)
+    def refresh(self):
+        snap = self.get_snapshot()
+        if snap is not None and snap is not self._drawn:
+            self.render(snap)
+            self._drawn = snap
+        self.after(50, self.refresh)
+
+    def set_label(self, lbl, text, fg):
+        # Skip the Tcl round-trip when nothing visible changed
+        if self._last.get(lbl) != (text, fg):
+            lbl.config(text=text, fg=fg)
+            self._last[lbl] = (text, fg)
+
+    def render(self, snap):
+        metrics, cpu, mbps = snap.gpus, snap.cpu, snap.net_mbps
+        set_label = self.set_label
+        pct_strs, watt_strs, temp_strs = self._pct_strs, self._watt_strs, self._temp_strs
+        # GPU들 모두 업데이트 (한 번의 조회로 전체 GPU)
+        if metrics is None:
+            for lbl in self._util_lbls:
+                set_label(lbl, "err", "#ef4444")
+            for lbl in self._power_lbls:
+                set_label(lbl, "n/a", "#f59e0b")
+            for lbl in self._temp_lbls:
+                set_label(lbl, "-- °C", "#9ca3af")
+            metrics = ()
+        for util_lbl, power_lbl, temp_lbl, sample in zip(
+                self._util_lbls, self._power_lbls, self._temp_lbls, metrics):
+            if sample is None:
+                continue  # no reading yet
+            util, power, temp = sample
+            if util is None and power is None and temp is None:
+                # This GPU failed entirely; mark only its labels
+                set_label(util_lbl, "err", "#ef4444")
+                set_label(power_lbl, "n/a", "#f59e0b")
+                set_label(temp_lbl, "-- °C", "#9ca3af")
+                continue
+            if util is None:
+                set_label(util_lbl, "n/a", "#f59e0b")
+            else:
+                set_label(util_lbl, text_from_table(pct_strs, util, "{:.0f}%"), color_for_util(util))
+            if power is None:
+                set_label(power_lbl, "n/a", "#f59e0b")
+            else:
+                set_label(power_lbl, text_from_table(watt_strs, power, "{:.0f} W"), "#e5e7eb")
+            if temp is None:
+                set_label(temp_lbl, "n/a", "#f59e0b")
+            else:
+                set_label(temp_lbl, text_from_table(temp_strs, temp, "{:.0f} °C"), color_for_temp(temp))
 
         # CPU
-        try:
-            cpu = get_cpu_percent()
-            self.lbl_cpu.config(text=f"{cpu:.0f}%", fg=color_for_cpu(cpu))
-        except Exception:
-            self.lbl_cpu.config(text="--%", fg="#9ca3af")
+        if cpu is None:
+            set_label(self.lbl_cpu, "--%", "#9ca3af")
+        else:
+            set_label(self.lbl_cpu, text_from_table(pct_strs, cpu, "{:.0f}%"), color_for_cpu(cpu))
 
         # NET
-        now = time.time()
-        curr_rx = get_net_bytes_recv(self.iface)
-        mbps = get_net_download_mbps(self._prev_rx, curr_rx, now - self._prev_time)
-        self._prev_rx, self._prev_time = curr_rx, now
-        self.lbl_net.config(text=f"{mbps:.2f} MB/s", fg="#9ca3af")
-
-        self.after(self.interval_ms, self.refresh)
\ No newline at end of file
+        set_label(self.lbl_net, f"{mbps:.2f} MB/s", "#9ca3af")
@@ -1,6 +1,6 @@
 import sys
 import argparse
-from .app import GPUMonitorStatusbar, have_nvidia_smi
+from .app import GPUMonitorStatusbar
 
 def main():
     p = argparse.ArgumentParser(description="Always-on-top GPU/CPU/NET mini - All GPUs")
@@ -10,14 +10,27 @@ def main():
     p.add_argument("--xmargin", type=int, default=8, help="Right margin from screen edge (px, default: 8)")
     a = p.parse_args()
 
-    if not have_nvidia_smi():
-        print("Error: nvidia-smi not found in PATH. Install NVIDIA drivers & CUDA toolkit.", file=sys.stderr)
+    try:
+        app = GPUMonitorStatusbar(
+            interval_ms=a.interval,
+            scale=a.scale,
+            iface=a.iface,
+            xmargin=a.xmargin,
+        )
+    except RuntimeError as e:
+        print(f"Error: {e} Install NVIDIA drivers & CUDA toolkit.", file=sys.stderr)
         sys.exit(1)
 
-    app = GPUMonitorStatusbar(
-        interval_ms=a.interval,
-        scale=a.scale,
-        iface=a.iface,
-        xmargin=a.xmargin,
-    )
+    # While running, our NVML session / nvidia-smi stream keeps the driver loaded;
+    # without persistence mode only startup (and other tools) pay the driver init.
+    try:
+        disabled = app.gpu.persistence_disabled()
+    except Exception:
+        disabled = []
+    if disabled:
+        gpus = ",".join(map(str, disabled))
+        print(f"Warning: persistence mode is disabled on GPU {gpus}; startup and first queries "
+              "may take seconds while the driver initialises. Run `sudo nvidia-smi -pm 1` to avoid this.",
+              file=sys.stderr)
+
     app.mainloop()